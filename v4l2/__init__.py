@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pixutils.formats import *
 
+from .controls import *
 from .helpers import *
 from .mbusformats import *
 from .media import *
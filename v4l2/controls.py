@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import errno
+import fcntl
+
+import v4l2.uapi
+from .helpers import cstr
+
+__all__ = [ 'V4lControl', 'query_controls' ]
+
+
+class V4lControl:
+    def __init__(self) -> None:
+        self.id = 0
+        self.type = 0
+        self.name = ''
+        self.minimum = 0
+        self.maximum = 0
+        self.step = 0
+        self.default_value = 0
+        self.flags = 0
+        self.elem_size = 0
+        self.elems = 0
+        self.dims: tuple[int, ...] = ()
+        self.menu_items: dict[int, str | int] = {}
+
+    @property
+    def is_menu(self):
+        return self.type in (v4l2.uapi.V4L2_CTRL_TYPE_MENU, v4l2.uapi.V4L2_CTRL_TYPE_INTEGER_MENU)
+
+    @property
+    def is_disabled(self):
+        return (self.flags & v4l2.uapi.V4L2_CTRL_FLAG_DISABLED) != 0
+
+    def __repr__(self) -> str:
+        return f"V4lControl({self.id:#x}, '{self.name}')"
+
+    @classmethod
+    def from_ext_ctrl(cls, ctrl: v4l2.uapi.v4l2_query_ext_ctrl):
+        c = V4lControl()
+        c.id = ctrl.id
+        c.type = ctrl.type
+        c.name = cstr(ctrl.name)
+        c.minimum = ctrl.minimum
+        c.maximum = ctrl.maximum
+        c.step = ctrl.step
+        c.default_value = ctrl.default_value
+        c.flags = ctrl.flags
+        c.elem_size = ctrl.elem_size
+        c.elems = ctrl.elems
+        c.dims = tuple(ctrl.dims[:ctrl.nr_of_dims])
+        return c
+
+
+def query_controls(fd) -> list[V4lControl]:
+    # Enumerate with NEXT_CTRL | NEXT_COMPOUND so a single pass covers both
+    # normal and compound controls.
+    next_flags = v4l2.uapi.V4L2_CTRL_FLAG_NEXT_CTRL | v4l2.uapi.V4L2_CTRL_FLAG_NEXT_COMPOUND
+
+    controls = []
+
+    # The query structs are reused across iterations: the kernel overwrites
+    # every field we care about, so it is enough to set the input fields.
+    ctrl = v4l2.uapi.v4l2_query_ext_ctrl()
+    querymenu = v4l2.uapi.v4l2_querymenu()
+
+    ctrl_id = next_flags
+
+    while True:
+        ctrl.id = ctrl_id
+
+        try:
+            fcntl.ioctl(fd, v4l2.uapi.VIDIOC_QUERY_EXT_CTRL, ctrl, True)
+        except OSError as e:
+            if e.errno in (errno.EINVAL, errno.ENOTTY):
+                break
+            raise
+
+        ctrlv = V4lControl.from_ext_ctrl(ctrl)
+
+        # Disabled controls cannot be queried further; in particular, skip the
+        # per-index QUERYMENU ioctls for them.
+        if ctrlv.is_menu and not ctrlv.is_disabled:
+            querymenu.id = ctrl.id
+
+            for i in range(ctrl.minimum, ctrl.maximum + 1):
+                querymenu.index = i
+
+                try:
+                    fcntl.ioctl(fd, v4l2.uapi.VIDIOC_QUERYMENU, querymenu, True)
+                except OSError as e:
+                    if e.errno == errno.EINVAL:
+                        continue
+                    raise
+
+                if ctrl.type == v4l2.uapi.V4L2_CTRL_TYPE_MENU:
+                    ctrlv.menu_items[i] = cstr(querymenu.name)
+                else:
+                    ctrlv.menu_items[i] = querymenu.value
+
+        controls.append(ctrlv)
+
+        ctrl_id = ctrl.id | next_flags
+
+    return controls
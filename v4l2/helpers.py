@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 from enum import Enum
+import functools
 import v4l2.uapi
 
 __all__ = [ 'BufType', 'MemType' ]
 
+def cstr(b) -> str:
+    # Handles both c_char and byte arrays, and guards against
+    # non-NUL-terminated driver strings.
+    return bytes(b).split(b'\0', 1)[0].decode('ascii', 'replace')
+
+# A (major, minor) pair identifies the device node for the lifetime of the
+# process, so the result can be cached.
+@functools.lru_cache(maxsize=None)
 def filepath_for_major_minor(major: int, minor: int):
     with open(f'/sys/dev/char/{major}:{minor}/uevent', encoding='ascii') as f:
-        for l in f.readlines():
+        for l in f:
             if not l.startswith('DEVNAME='):
                 continue
             path = l[len('DEVNAME='):].strip()
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import collections
 import ctypes
 import fcntl
+import itertools
 import weakref
 import os
 import glob
 import fnmatch
+import re
 import v4l2.uapi
-from .helpers import filepath_for_major_minor
+from .helpers import cstr, filepath_for_major_minor
 from .enums import MediaEntityFunction, MediaLinkFlag, MediaPadFlag, MediaInterfaceType
 
 __all__ = [
@@ -33,14 +36,14 @@ class MediaObject:
         self.id = id
 
     def _finalize(self):
-        self.links = [l for l in self.md.links if self.id in (l.media_link.source_id, l.media_link.sink_id)]
+        self.links = self.md._links_by_endpoint[self.id]       # pylint: disable=protected-access
 
 
 class MediaEntity(MediaObject):
     def __init__(self, md, media_entity: v4l2.uapi.media_v2_entity) -> None:
         super().__init__(md, media_entity.id)
         self.media_entity = media_entity
-        self.name = media_entity.name.decode('ascii')
+        self.name = cstr(media_entity.name)
         self.function = MediaEntityFunction(media_entity.function)
         self.flags = media_entity.flags
         self.pads: list[MediaPad] = None # type: ignore
@@ -48,12 +51,12 @@ class MediaEntity(MediaObject):
 
     def _finalize(self):
         super()._finalize()
-        self.pads = [p for p in self.md.pads if p.media_pad.entity_id == self.id]
+        self.pads = self.md._pads_by_entity[self.id]       # pylint: disable=protected-access
 
         ifaces = []
 
-        for ids in [(l.media_link.source_id, l.media_link.sink_id) for l in self.links]:
-            for id in ids:
+        for l in self.links:
+            for id in (l._source_id, l._sink_id):       # pylint: disable=protected-access
                 ob = self.md.find_id(id)
 
                 if not isinstance(ob, MediaInterface):
@@ -72,7 +75,7 @@ class MediaEntity(MediaObject):
 
     @property
     def pad_links(self) -> list[MediaLink]:
-        return [l for p in self.pads for l in p.links]
+        return list(itertools.chain.from_iterable(p.links for p in self.pads))
 
 
 class MediaInterface(MediaObject):
@@ -103,44 +106,60 @@ class MediaPad(MediaObject):
         super().__init__(md, media_pad.id)
         self.media_pad = media_pad
         self.index = media_pad.index
+        self._entity_id = media_pad.entity_id
+        self._raw_flags = media_pad.flags
+        self._flags = MediaPadFlag(self._raw_flags)
         self.entity: MediaEntity = None # type: ignore
 
     def _finalize(self):
         super()._finalize()
-        self.entity = next(e for e in self.md.entities if e.id == self.media_pad.entity_id)
+        self.entity = self.md._by_id[self._entity_id]       # pylint: disable=protected-access
 
     def __repr__(self) -> str:
         return f"MediaPad({self.id}, '{self.entity.name}':{self.index})"
 
     @property
     def is_source(self):
-        return (self.media_pad.flags & v4l2.uapi.MEDIA_PAD_FL_SOURCE) != 0
+        return (self._raw_flags & v4l2.uapi.MEDIA_PAD_FL_SOURCE) != 0
 
     @property
     def is_sink(self):
-        return (self.media_pad.flags & v4l2.uapi.MEDIA_PAD_FL_SINK) != 0
+        return (self._raw_flags & v4l2.uapi.MEDIA_PAD_FL_SINK) != 0
 
     @property
     def is_internal(self):
-        return (self.media_pad.flags & v4l2.uapi.MEDIA_PAD_FL_INTERNAL) != 0
+        return (self._raw_flags & v4l2.uapi.MEDIA_PAD_FL_INTERNAL) != 0
 
     @property
     def flags(self) -> MediaPadFlag:
-        return MediaPadFlag(self.media_pad.flags)
+        return self._flags
 
 
 class MediaLink(MediaObject):
     def __init__(self, md, media_link: v4l2.uapi.media_v2_link) -> None:
         super().__init__(md, media_link.id)
         self.media_link = media_link
+        self._source_id = media_link.source_id
+        self._sink_id = media_link.sink_id
         self.flags = media_link.flags
         self.source: MediaObject = None # type: ignore
         self.sink: MediaObject = None # type: ignore
+        self._setup_desc: v4l2.uapi.media_link_desc | None = None
 
     def _finalize(self):
         super()._finalize()
-        self.source = next(e for e in self.md.objects if e.id == self.media_link.source_id)
-        self.sink = next(e for e in self.md.objects if e.id == self.media_link.sink_id)
+        self.source = self.md._by_id[self._source_id]       # pylint: disable=protected-access
+        self.sink = self.md._by_id[self._sink_id]       # pylint: disable=protected-access
+
+        # The endpoints never change, so the setup desc can be prefilled and
+        # reused for every enable/disable.
+        if isinstance(self.source, MediaPad) and isinstance(self.sink, MediaPad):
+            desc = v4l2.uapi.media_link_desc()
+            desc.source.entity = self.source._entity_id       # pylint: disable=protected-access
+            desc.source.index = self.source.index
+            desc.sink.entity = self.sink._entity_id       # pylint: disable=protected-access
+            desc.sink.index = self.sink.index
+            self._setup_desc = desc
 
     def __repr__(self) -> str:
         return f'MediaLink({self.id}, {self.source}->{self.sink})'
@@ -172,11 +191,10 @@ class MediaLink(MediaObject):
         self._setup(0)
 
     def _setup(self, flags):
-        desc = v4l2.uapi.media_link_desc()
-        desc.source.entity = self.source_pad.entity.id
-        desc.source.index = self.source_pad.index
-        desc.sink.entity = self.sink_pad.entity.id
-        desc.sink.index = self.sink_pad.index
+        if self._setup_desc is None:
+            raise RuntimeError('Source or sink is not a MediaPad')
+
+        desc = self._setup_desc
         desc.flags = flags
 
         fcntl.ioctl(self.md.fd, v4l2.uapi.MEDIA_IOC_SETUP_LINK, desc, False)
@@ -196,9 +214,49 @@ class MediaDevice:
 
         weakref.finalize(self, os.close, self.fd)
 
+    @staticmethod
+    def __driver_from_sysfs(path: str) -> str | None:
+        try:
+            st = os.stat(path)
+            major, minor = os.major(st.st_rdev), os.minor(st.st_rdev)
+
+            with open(f'/sys/dev/char/{major}:{minor}/device/uevent', encoding='ascii') as f:
+                for l in f:
+                    if l.startswith('DRIVER='):
+                        return l[len('DRIVER='):].strip()
+        except OSError:
+            pass
+
+        return None
+
     @staticmethod
     def __find_media_device_by_value(key: str, value: str) -> str:
-        for path in glob.glob('/dev/media*'):
+        paths = glob.glob('/dev/media*')
+
+        # Wildcards follow fnmatch semantics; translate and compile the
+        # pattern once instead of per candidate.
+        match = re.compile(fnmatch.translate(value)).match
+
+        # The driver name is available from sysfs, so matching on it does not
+        # need an open + MEDIA_IOC_DEVICE_INFO ioctl per node. The other
+        # attributes (model, bus_info, serial) are only exposed via the ioctl.
+        if key == 'driver':
+            sysfs_ok = True
+
+            for path in paths:
+                driver = MediaDevice.__driver_from_sysfs(path)
+
+                if driver is None:
+                    sysfs_ok = False
+                    continue
+
+                if match(driver):
+                    return path
+
+            if sysfs_ok:
+                raise FileNotFoundError(f'No media device "{key}" = "{value}" found')
+
+        for path in paths:
             try:
                 fd = os.open(path, os.O_RDWR | os.O_NONBLOCK)
             except OSError:
@@ -210,7 +268,7 @@ class MediaDevice:
 
                 device_val = getattr(mdi, key).decode()
 
-                if fnmatch.fnmatch(device_val, value):
+                if match(device_val):
                     return path
             finally:
                 os.close(fd)
@@ -233,10 +291,10 @@ class MediaDevice:
         mdi = v4l2.uapi.media_device_info()
         fcntl.ioctl(self.fd, v4l2.uapi.MEDIA_IOC_DEVICE_INFO, mdi, True)
 
-        self.driver = mdi.driver.decode()
-        self.model = mdi.model.decode()
-        self.serial = mdi.serial.decode()
-        self.bus_info = mdi.bus_info.decode()
+        self.driver = cstr(mdi.driver)
+        self.model = cstr(mdi.model)
+        self.serial = cstr(mdi.serial)
+        self.bus_info = cstr(mdi.bus_info)
         self.media_version = MediaDevice.__decode_kernel_version(mdi.media_version)
         self.hw_revision = mdi.hw_revision
         self.driver_version = MediaDevice.__decode_kernel_version(mdi.driver_version)
@@ -261,36 +319,52 @@ class MediaDevice:
 
         self.topology = MediaTopology(topology, entities, interfaces, pads, links)
 
-        self.objects = \
-            [MediaEntity(self, e) for e in self.topology.entities] + \
-            [MediaInterface(self, i) for i in self.topology.interfaces] + \
-            [MediaPad(self, p) for p in self.topology.pads] + \
-            [MediaLink(self, l) for l in self.topology.links]
+        self._entities = [MediaEntity(self, e) for e in self.topology.entities]
+        self._interfaces = [MediaInterface(self, i) for i in self.topology.interfaces]
+        self._pads = [MediaPad(self, p) for p in self.topology.pads]
+        self._links = [MediaLink(self, l) for l in self.topology.links]
+
+        self.objects = self._entities + self._interfaces + self._pads + self._links
+
+        self._by_id = {o.id: o for o in self.objects}
+
+        self._pads_by_entity: dict[int, list[MediaPad]] = collections.defaultdict(list)
+        for p in self._pads:
+            self._pads_by_entity[p._entity_id].append(p)       # pylint: disable=protected-access
+
+        self._links_by_endpoint: dict[int, list[MediaLink]] = collections.defaultdict(list)
+        for l in self._links:
+            self._links_by_endpoint[l._source_id].append(l)       # pylint: disable=protected-access
+            if l._sink_id != l._source_id:                        # pylint: disable=protected-access
+                self._links_by_endpoint[l._sink_id].append(l)     # pylint: disable=protected-access
 
         for o in self.objects:
             o._finalize()       # pylint: disable=protected-access
 
     @property
-    def entities(self):
-        yield from [o for o in self.objects if isinstance(o, MediaEntity)]
+    def entities(self) -> list[MediaEntity]:
+        return self._entities
 
     @property
-    def pads(self):
-        yield from [o for o in self.objects if isinstance(o, MediaPad)]
+    def pads(self) -> list[MediaPad]:
+        return self._pads
 
     @property
-    def links(self):
-        yield from [o for o in self.objects if isinstance(o, MediaLink)]
+    def links(self) -> list[MediaLink]:
+        return self._links
 
     @property
-    def interfaces(self):
-        yield from [o for o in self.objects if isinstance(o, MediaInterface)]
+    def interfaces(self) -> list[MediaInterface]:
+        return self._interfaces
 
     def find_id(self, id) -> MediaObject | None:
-        return next((o for o in self.objects if o.id == id), None)
+        return self._by_id.get(id)
 
     def find_entity(self, name):
-        for e in self.entities:
-            if fnmatch.fnmatch(e.name, name):
+        # Wildcards follow fnmatch semantics; translate and compile the
+        # pattern once instead of per entity.
+        match = re.compile(fnmatch.translate(name)).match
+        for e in self._entities:
+            if match(e.name):
                 return e
         return None
@@ -4,9 +4,11 @@ import ctypes
 import errno
 import fcntl
 import os
+import weakref
 from enum import IntFlag
 
 import v4l2.uapi
+from .controls import V4lControl, query_controls
 
 __all__ = [ 'RouteFlag', 'Route', 'SubDevice' ]
 
@@ -58,6 +60,8 @@ class SubDevice:
         self.fd = os.open(dev_path, os.O_RDWR | os.O_NONBLOCK)
         assert(self.fd != -1)
 
+        weakref.finalize(self, os.close, self.fd)
+
         try:
             cap = v4l2.uapi.v4l2_subdev_client_capability()
             cap.capabilities = v4l2.uapi.V4L2_SUBDEV_CLIENT_CAP_STREAMS
@@ -151,6 +155,12 @@ class SubDevice:
         routing = v4l2.uapi.v4l2_subdev_routing()
         routing.which = which
 
+        # Most subdevs have only a handful of routes, so provide a small
+        # buffer up front and the common case completes in a single ioctl.
+        routes = (v4l2.uapi.v4l2_subdev_route * 8)()
+        routing.routes = ctypes.addressof(routes)
+        routing.len_routes = len(routes)
+
         try:
             fcntl.ioctl(self.fd, v4l2.uapi.VIDIOC_SUBDEV_G_ROUTING, routing, True)
         except OSError as e:
@@ -159,21 +169,14 @@ class SubDevice:
             if e.errno != errno.ENOSPC:
                 raise
 
-        routes = (v4l2.uapi.v4l2_subdev_route * routing.num_routes)()
-        routing.routes = ctypes.addressof(routes)
-        routing.len_routes = routing.num_routes
+        if routing.num_routes > len(routes):
+            routes = (v4l2.uapi.v4l2_subdev_route * routing.num_routes)()
+            routing.routes = ctypes.addressof(routes)
+            routing.len_routes = routing.num_routes
 
-        try:
             fcntl.ioctl(self.fd, v4l2.uapi.VIDIOC_SUBDEV_G_ROUTING, routing, True)
-        except OSError as e:
-            if e.errno == errno.ENOTTY:
-                routes = (v4l2.uapi.v4l2_subdev_route * 0)()
-            else:
-                raise
 
-        routes = [Route.from_v4l2_subdev_route(r) for r in routes]
-
-        return routes
+        return [Route.from_v4l2_subdev_route(routes[i]) for i in range(routing.num_routes)]
 
     def set_routes(self, routes: list[Route], which=v4l2.uapi.V4L2_SUBDEV_FORMAT_ACTIVE) -> list[Route]:
         # Allocate extra space for return routes
@@ -239,6 +242,9 @@ class SubDevice:
 
         return (v4l2_ival.interval.numerator, v4l2_ival.interval.denominator)
 
+    def get_controls(self) -> list[V4lControl]:
+        return query_controls(self.fd)
+
     def set_control(self, ctrl_id: int, ctrl_val: int):
         v4l2_ctrl = v4l2.uapi.v4l2_control()
         v4l2_ctrl.id = ctrl_id
@@ -3,19 +3,11 @@ from enum import IntEnum
 from .v4l2 import *
 
 def fourcc_to_str(fourcc: int):
-    return ''.join((
-        chr((fourcc >> 0) & 0xff),
-        chr((fourcc >> 8) & 0xff),
-        chr((fourcc >> 16) & 0xff),
-        chr((fourcc >> 24) & 0xff)
-    ))
+    return fourcc.to_bytes(4, 'little').decode('latin-1')
 
 def str_to_fourcc(s: str):
-    return \
-        ord(s[0]) << 0 | \
-        ord(s[1]) << 8 | \
-        ord(s[2]) << 16 | \
-        ord(s[3]) << 24
+    assert len(s) == 4
+    return int.from_bytes(s.encode('ascii'), 'little')
 
 def __v4l2_subdev_format_to_str(self: v4l2_subdev_format):
     return f'v4l2_subdev_format({self.format.width}x{self.format.height}-0x{self.format.code:x})'
@@ -7,8 +7,10 @@ import fcntl
 import fnmatch
 import glob
 import os
+import weakref
 
 import v4l2.uapi
+from .controls import V4lControl, query_controls
 
 __all__ = [ 'VideoDevice', 'VideoBuffer' ]
 
@@ -18,6 +20,8 @@ class VideoDevice:
         self.fd = os.open(dev_path, os.O_RDWR | os.O_NONBLOCK)
         assert(self.fd != -1)
 
+        weakref.finalize(self, os.close, self.fd)
+
         cap = v4l2.uapi.v4l2_capability()
         fcntl.ioctl(self.fd, v4l2.uapi.VIDIOC_QUERYCAP, cap, True)
 
@@ -66,9 +70,6 @@ class VideoDevice:
         else:
             self.has_meta_output = False
 
-    def __del__(self):
-        os.close(self.fd)
-
     @staticmethod
     def find_video_device(key: str, value: str) -> str:
         for path in glob.glob('/dev/video*'):
@@ -152,6 +153,9 @@ class VideoDevice:
 
         return fmts
 
+    def get_controls(self) -> list[V4lControl]:
+        return query_controls(self.fd)
+
     def get_format(self, buf_type: v4l2.BufType):
         fmt = v4l2.uapi.v4l2_format()
         fmt.type = buf_type.value